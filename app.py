@@ -2,18 +2,24 @@ import streamlit as st
 import os
 from huggingface_hub import InferenceClient
 
+# Streamlit app configuration (must run before any other Streamlit command)
+st.set_page_config(page_title="Call Center AI Guide", page_icon="📞")
+
+# Cache the client so it is not rebuilt on every Streamlit rerun
+@st.cache_resource
+def get_client(token):
+    return InferenceClient(token=token, timeout=30)
+
 # Initialize Hugging Face Inference Client
 try:
     hf_token = st.secrets["HF_TOKEN"] if "HF_TOKEN" in st.secrets else os.getenv("HF_TOKEN")
     if not hf_token:
         raise ValueError("Hugging Face API token not found. Set HF_TOKEN in Streamlit secrets or environment variables.")
-    client = InferenceClient(token=hf_token)
+    client = get_client(hf_token)
 except Exception as e:
     st.error(f"Error initializing Hugging Face client: {str(e)}")
     st.stop()
 
-# Streamlit app configuration
-st.set_page_config(page_title="Call Center AI Guide", page_icon="📞")
 st.title("📞 Call Center AI Guide")
 st.markdown("Ask your question, and our AI will provide a professional response to assist you.")
 
@@ -52,25 +58,38 @@ if user_input:
         "Respond appropriately:"
     )
 
+    # Placeholder for the AI response, cleared if generation fails partway
+    response_placeholder = st.empty()
+
     try:
         # Call Hugging Face Inference API
-        response = client.text_generation(
+        stream = client.text_generation(
             prompt,
             model="mistralai/Mixtral-8x7B-Instruct-v0.1",
             max_new_tokens=200,
             temperature=0.7,
-            do_sample=True
+            do_sample=True,
+            stream=True,
+            details=True
         )
 
+        # Display AI response as tokens arrive, skipping special tokens such as </s>
+        with response_placeholder.container():
+            with st.chat_message("assistant"):
+                response = st.write_stream(
+                    chunk.token.text for chunk in stream if not chunk.token.special
+                )
+
+        # st.write_stream returns a non-string when no text was written (e.g. only </s> was streamed)
+        if not isinstance(response, str):
+            response = ""
+
         # Clean and format response
         response = response.strip()
 
         # Add AI response to history
         st.session_state.messages.append({"role": "assistant", "content": response})
 
-        # Display AI response
-        with st.chat_message("assistant"):
-            st.markdown(response)
-
     except Exception as e:
+        response_placeholder.empty()
         st.error(f"Error generating response: {str(e)}")